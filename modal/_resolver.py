@@ -3,7 +3,7 @@ import asyncio
 import contextlib
 import typing
 from asyncio import Future
-from typing import TYPE_CHECKING, Dict, Hashable, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Dict, Hashable, List, Optional, TypeVar
 
 from grpclib import GRPCError, Status
 
@@ -16,6 +16,8 @@ if TYPE_CHECKING:
 
     from modal.object import _Object
 
+T = TypeVar("T")
+
 
 class StatusRow:
     def __init__(self, progress: "typing.Optional[Tree]"):
@@ -142,6 +144,14 @@ class Resolver:
         # TODO(elias): print original exception/trace rather than the Resolver-internal trace
         return await cached_future
 
+    async def deduplicate(self, key: Hashable, create: Callable[[], Coroutine[Any, Any, T]]) -> T:
+        """Run `create` only once per key within this resolver, sharing the result with all callers."""
+        cached_future = self._deduplication_cache.get(key)
+        if not cached_future:
+            cached_future = asyncio.create_task(create())
+            self._deduplication_cache[key] = cached_future
+        return await cached_future
+
     def objects(self) -> List["_Object"]:
         unique_objects: Dict[str, "_Object"] = {}
         for fut in self._local_uuid_to_future.values():
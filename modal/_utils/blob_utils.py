@@ -1,5 +1,6 @@
 # Copyright Modal Labs 2022
 import asyncio
+import base64
 import dataclasses
 import hashlib
 import io
@@ -7,7 +8,7 @@ import os
 import platform
 from contextlib import AbstractContextManager, contextmanager
 from pathlib import Path, PurePosixPath
-from typing import Any, AsyncIterator, BinaryIO, Callable, List, Optional, Union
+from typing import Any, AsyncIterator, BinaryIO, Callable, Dict, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 from aiohttp import BytesIOPayload
@@ -19,7 +20,7 @@ from modal_proto.modal_api_grpc import ModalClientModal
 from ..exception import ExecutionError
 from .async_utils import TaskContext, retry
 from .grpc_utils import retry_transient_errors
-from .hash_utils import UploadHashes, get_sha256_hex, get_upload_hashes
+from .hash_utils import UploadHashes, get_md5_base64, get_sha256_hex, get_upload_hashes
 from .http_utils import ClientSessionRegistry
 from .logger import logger
 
@@ -36,6 +37,15 @@ BLOB_MAX_PARALLELISM = 10
 # read ~16MiB chunks by default
 DEFAULT_SEGMENT_CHUNK_SIZE = 2**24
 
+# (st_ino, st_mtime_ns, st_ctime_ns, st_size) of a file. The ctime can't be set by user tools
+# like `cp -p` or `touch -r`, so any rewrite of the file changes the signature.
+FileStatSignature = Tuple[int, int, int, int]
+
+# Checksums of large files, keyed by path along with the stat signature they were computed for, so that
+# repeated uploads of an unchanged file within the same process (e.g. mounts being reloaded by `modal serve`)
+# don't re-hash it. Holds at most one entry per path.
+_large_file_sha256_cache: Dict[str, Tuple[FileStatSignature, str]] = {}
+
 
 class BytesIOSegmentPayload(BytesIOPayload):
     """Modified bytes payload for concurrent sends of chunks from the same file.
@@ -296,9 +306,20 @@ async def blob_upload(payload: bytes, stub: ModalClientModal) -> str:
 
 
 async def blob_upload_file(
-    file_obj: BinaryIO, stub: ModalClientModal, progress_report_cb: Optional[Callable] = None
+    file_obj: BinaryIO,
+    stub: ModalClientModal,
+    progress_report_cb: Optional[Callable] = None,
+    sha256_hex: Optional[str] = None,  # already known checksum of the file, to avoid hashing it again
 ) -> str:
-    upload_hashes = get_upload_hashes(file_obj)
+    # Hashing can take a while for large files, so do it in a thread to avoid blocking the event loop
+    loop = asyncio.get_event_loop()
+    if sha256_hex is None:
+        upload_hashes = await loop.run_in_executor(None, get_upload_hashes, file_obj)
+    else:
+        upload_hashes = UploadHashes(
+            md5_base64=await loop.run_in_executor(None, get_md5_base64, file_obj),
+            sha256_base64=base64.b64encode(bytes.fromhex(sha256_hex)).decode("ascii"),
+        )
     return await _blob_upload(upload_hashes, file_obj, stub, progress_report_cb)
 
 
@@ -360,6 +381,7 @@ def _get_file_upload_spec(
     source_description: Any,
     mount_filename: PurePosixPath,
     mode: int,
+    cache_key: Optional[Tuple[str, FileStatSignature]] = None,
 ) -> FileUploadSpec:
     with source() as fp:
         # Current position is ignored - we always upload from position 0
@@ -370,7 +392,16 @@ def _get_file_upload_spec(
         if size >= LARGE_FILE_LIMIT:
             use_blob = True
             content = None
-            sha256_hex = get_sha256_hex(fp)
+            if cache_key is None:
+                sha256_hex = get_sha256_hex(fp)
+            else:
+                path, signature = cache_key
+                cached = _large_file_sha256_cache.get(path)
+                if cached is not None and cached[0] == signature:
+                    sha256_hex = cached[1]
+                else:
+                    sha256_hex = get_sha256_hex(fp)
+                    _large_file_sha256_cache[path] = (signature, sha256_hex)
         else:
             use_blob = False
             content = fp.read()
@@ -393,12 +424,14 @@ def get_file_upload_spec_from_path(
 ) -> FileUploadSpec:
     # Python appears to give files 0o666 bits on Windows (equal for user, group, and global),
     # so we mask those out to 0o755 for compatibility with POSIX-based permissions.
-    mode = mode or os.stat(filename).st_mode & (0o7777 if platform.system() != "Windows" else 0o7755)
+    stat = os.stat(filename)
+    mode = mode or stat.st_mode & (0o7777 if platform.system() != "Windows" else 0o7755)
     return _get_file_upload_spec(
         lambda: open(filename, "rb"),
         filename,
         mount_filename,
         mode,
+        cache_key=(os.fspath(filename), (stat.st_ino, stat.st_mtime_ns, stat.st_ctime_ns, stat.st_size)),
     )
 
 
@@ -2,26 +2,53 @@
 import base64
 import dataclasses
 import hashlib
-from typing import BinaryIO, Callable, List, Union
+import io
+import os
+from typing import BinaryIO, Callable, List, Optional, Union
 
-HASH_CHUNK_SIZE = 4096
+HASH_CHUNK_SIZE = 4 * 1024 * 1024  # 4 MiB, large enough for hashlib to release the GIL for long stretches
 
 
-def _update(hashers: List[Callable[[bytes], None]], data: Union[bytes, BinaryIO]) -> None:
+def _update(hashers: List[Callable[[Union[bytes, memoryview]], None]], data: Union[bytes, BinaryIO]) -> None:
     if isinstance(data, bytes):
         for hasher in hashers:
             hasher(data)
     else:
         assert not isinstance(data, (bytearray, memoryview))  # https://github.com/microsoft/pyright/issues/5697
         pos = data.tell()
+        if isinstance(data, io.BytesIO):
+            # Already in memory, so hash the underlying buffer without copying it
+            with data.getbuffer() as bytes_view, bytes_view[pos:] as chunk:
+                for hasher in hashers:
+                    hasher(chunk)
+            return
+
+        readinto: Optional[Callable[[bytearray], Optional[int]]] = getattr(data, "readinto", None)
+        if readinto is None:
+            # Plain file-like objects that only implement read()
+            while True:
+                chunk = data.read(HASH_CHUNK_SIZE)
+                if not isinstance(chunk, bytes):
+                    raise ValueError(f"Only accepts bytes or byte buffer objects, not {type(chunk)} buffers")
+                if not chunk:
+                    break
+                for hasher in hashers:
+                    hasher(chunk)
+            data.seek(pos)
+            return
+
+        # Read into a single reusable buffer, so hashing large files doesn't allocate a new bytes object per chunk.
+        # The buffer is capped at the remaining size to keep hashing of small streams cheap.
+        remaining = max(data.seek(0, os.SEEK_END) - pos, 0)
+        data.seek(pos)
+        buf = bytearray(min(HASH_CHUNK_SIZE, remaining))
+        view = memoryview(buf)
         while True:
-            chunk = data.read(HASH_CHUNK_SIZE)
-            if not isinstance(chunk, bytes):
-                raise ValueError(f"Only accepts bytes or byte buffer objects, not {type(chunk)} buffers")
-            if not chunk:
+            n = readinto(buf)
+            if not n:
                 break
             for hasher in hashers:
-                hasher(chunk)
+                hasher(view[:n])
         data.seek(pos)
 
 
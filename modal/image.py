@@ -1,5 +1,7 @@
 # Copyright Modal Labs 2022
 import contextlib
+import functools
+import hashlib
 import json
 import os
 import re
@@ -110,10 +112,15 @@ def _dockerhub_python_version(builder_version: ImageBuilderVersion, python_versi
     return f"{python_series_requested}.{micro_version}"
 
 
-def _base_image_config(group: str, builder_version: ImageBuilderVersion) -> Any:
+@functools.lru_cache(maxsize=None)
+def _load_base_image_config() -> Dict[str, Any]:
+    # The config file ships with the client, so it only needs to be parsed once per process
     with open(LOCAL_REQUIREMENTS_DIR / "base-images.json", "r") as f:
-        data = json.load(f)
-    return data[group][builder_version]
+        return json.load(f)
+
+
+def _base_image_config(group: str, builder_version: ImageBuilderVersion) -> Any:
+    return _load_base_image_config()[group][builder_version]
 
 
 def _get_modal_requirements_path(builder_version: ImageBuilderVersion, python_version: Optional[str] = None) -> str:
@@ -406,58 +413,69 @@ class _Image(_Object, type_prefix="im"):
                 # Only admins can publish to the global namespace, but they have to additionally request it.
                 allow_global_deployment=os.environ.get("MODAL_IMAGE_ALLOW_GLOBAL_DEPLOYMENT", "0") == "1",
             )
-            resp = await retry_transient_errors(resolver.client.stub.ImageGetOrCreate, req)
-            image_id = resp.image_id
-
-            logger.debug("Waiting for image %s" % image_id)
-            last_entry_id: Optional[str] = None
-            result: Optional[api_pb2.GenericResult] = None
-
-            async def join():
-                nonlocal last_entry_id, result
-
-                request = api_pb2.ImageJoinStreamingRequest(image_id=image_id, timeout=55, last_entry_id=last_entry_id)
-                async for response in resolver.client.stub.ImageJoinStreaming.unary_stream(request):
-                    if response.entry_id:
-                        last_entry_id = response.entry_id
-                    if response.result.status:
-                        result = response.result
-                    for task_log in response.task_logs:
-                        if task_log.task_progress.pos or task_log.task_progress.len:
-                            assert task_log.task_progress.progress_type == api_pb2.IMAGE_SNAPSHOT_UPLOAD
-                            if output_mgr := _get_output_manager():
-                                output_mgr.update_snapshot_progress(image_id, task_log.task_progress)
-                        elif task_log.data:
-                            if output_mgr := _get_output_manager():
-                                await output_mgr.put_log_content(task_log)
-                if output_mgr := _get_output_manager():
-                    output_mgr.flush_lines()
-
-            # Handle up to n exceptions while fetching logs
-            retry_count = 0
-            while result is None:
-                try:
-                    await join()
-                except (StreamTerminatedError, GRPCError) as exc:
-                    if isinstance(exc, GRPCError) and exc.status not in RETRYABLE_GRPC_STATUS_CODES:
-                        raise exc
-                    retry_count += 1
-                    if retry_count >= 3:
-                        raise exc
-
-            if result.status == api_pb2.GenericResult.GENERIC_STATUS_FAILURE:
-                raise RemoteError(f"Image build for {image_id} failed with the exception:\n{result.exception}")
-            elif result.status == api_pb2.GenericResult.GENERIC_STATUS_TERMINATED:
-                raise RemoteError(f"Image build for {image_id} terminated due to external shut-down. Please try again.")
-            elif result.status == api_pb2.GenericResult.GENERIC_STATUS_TIMEOUT:
-                raise RemoteError(
-                    f"Image build for {image_id} timed out. Please try again with a larger `timeout` parameter."
-                )
-            elif result.status == api_pb2.GenericResult.GENERIC_STATUS_SUCCESS:
-                pass
-            else:
-                raise RemoteError("Unknown status %s!" % result.status)
 
+            async def _create_image() -> str:
+                resp = await retry_transient_errors(resolver.client.stub.ImageGetOrCreate, req)
+                image_id = resp.image_id
+
+                logger.debug("Waiting for image %s" % image_id)
+                last_entry_id: Optional[str] = None
+                result: Optional[api_pb2.GenericResult] = None
+
+                async def join():
+                    nonlocal last_entry_id, result
+
+                    request = api_pb2.ImageJoinStreamingRequest(
+                        image_id=image_id, timeout=55, last_entry_id=last_entry_id
+                    )
+                    async for response in resolver.client.stub.ImageJoinStreaming.unary_stream(request):
+                        if response.entry_id:
+                            last_entry_id = response.entry_id
+                        if response.result.status:
+                            result = response.result
+                        for task_log in response.task_logs:
+                            if task_log.task_progress.pos or task_log.task_progress.len:
+                                assert task_log.task_progress.progress_type == api_pb2.IMAGE_SNAPSHOT_UPLOAD
+                                if output_mgr := _get_output_manager():
+                                    output_mgr.update_snapshot_progress(image_id, task_log.task_progress)
+                            elif task_log.data:
+                                if output_mgr := _get_output_manager():
+                                    await output_mgr.put_log_content(task_log)
+                    if output_mgr := _get_output_manager():
+                        output_mgr.flush_lines()
+
+                # Handle up to n exceptions while fetching logs
+                retry_count = 0
+                while result is None:
+                    try:
+                        await join()
+                    except (StreamTerminatedError, GRPCError) as exc:
+                        if isinstance(exc, GRPCError) and exc.status not in RETRYABLE_GRPC_STATUS_CODES:
+                            raise exc
+                        retry_count += 1
+                        if retry_count >= 3:
+                            raise exc
+
+                if result.status == api_pb2.GenericResult.GENERIC_STATUS_FAILURE:
+                    raise RemoteError(f"Image build for {image_id} failed with the exception:\n{result.exception}")
+                elif result.status == api_pb2.GenericResult.GENERIC_STATUS_TERMINATED:
+                    raise RemoteError(
+                        f"Image build for {image_id} terminated due to external shut-down. Please try again."
+                    )
+                elif result.status == api_pb2.GenericResult.GENERIC_STATUS_TIMEOUT:
+                    raise RemoteError(
+                        f"Image build for {image_id} timed out. Please try again with a larger `timeout` parameter."
+                    )
+                elif result.status == api_pb2.GenericResult.GENERIC_STATUS_SUCCESS:
+                    pass
+                else:
+                    raise RemoteError("Unknown status %s!" % result.status)
+
+                return image_id
+
+            # Identical image definitions are only built once per app, even if they're separate Image objects
+            definition_hash = hashlib.blake2b(req.SerializeToString(deterministic=True), digest_size=16).digest()
+            image_id = await resolver.deduplicate((_Image._type_prefix, "definition", definition_hash), _create_image)
             self._hydrate(image_id, resolver.client, None)
 
         rep = "Image()"
@@ -7,6 +7,7 @@ import os
 import site
 import sys
 import sysconfig
+import threading
 import time
 import typing
 from pathlib import Path, PurePosixPath
@@ -86,12 +87,41 @@ class _MountEntry(metaclass=abc.ABCMeta):
         ...
 
 
+def _iter_files(entries: List[_MountEntry]) -> typing.Iterator[Tuple[Path, PurePosixPath]]:
+    seen: typing.Set[Tuple[Path, PurePosixPath]] = set()
+    for entry in entries:
+        for file in entry.get_files_to_upload():
+            if file not in seen:
+                seen.add(file)
+                yield file
+
+
 def _select_files(entries: List[_MountEntry]) -> List[Tuple[Path, PurePosixPath]]:
-    # TODO: make this async
-    all_files: typing.Set[Tuple[Path, PurePosixPath]] = set()
+    return list(_iter_files(entries))
+
+
+def _walk_files(path: str, rel_prefix: str = "") -> typing.Iterator[Tuple[str, str]]:
+    # Equivalent to iterating over the files from os.walk(path), but uses the os.scandir entries directly
+    # and builds up the posix relative path of each file along the way, instead of re-deriving it per file.
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except OSError:
+        # os.walk ignores directories that can't be listed
+        return
+
     for entry in entries:
-        all_files |= set(entry.get_files_to_upload())
-    return list(all_files)
+        rel_path = rel_prefix + entry.name
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+
+        if not is_dir:
+            yield entry.path, rel_path
+        elif not entry.is_symlink():
+            # like os.walk, don't follow symlinks to directories
+            yield from _walk_files(entry.path, rel_path + "/")
 
 
 @dataclasses.dataclass
@@ -138,14 +168,13 @@ class _MountDir(_MountEntry):
             raise NotADirectoryError(local_dir)
 
         if self.recursive:
-            gen = (os.path.join(root, name) for root, dirs, files in os.walk(local_dir) for name in files)
+            gen = _walk_files(str(local_dir))
         else:
-            gen = (dir_entry.path for dir_entry in os.scandir(local_dir) if dir_entry.is_file())
+            gen = ((dir_entry.path, dir_entry.name) for dir_entry in os.scandir(local_dir) if dir_entry.is_file())
 
-        for local_filename in gen:
+        for local_filename, local_relpath in gen:
             if self.condition(local_filename):
-                local_relpath = Path(local_filename).expanduser().absolute().relative_to(local_dir)
-                mount_path = self.remote_path / local_relpath.as_posix()
+                mount_path = self.remote_path / local_relpath
                 yield local_filename, mount_path
 
     def watch_entry(self):
@@ -159,24 +188,34 @@ def module_mount_condition(module_base: Path):
     SKIP_BYTECODE = True  # hard coded for now
     SKIP_DOT_PREFIXED = True
 
+    module_base_prefix = os.path.join(str(module_base), "")
+
     def condition(f: str):
-        path = Path(f)
-        if SKIP_BYTECODE and path.suffix == ".pyc":
+        if SKIP_BYTECODE and os.path.splitext(f)[1] == ".pyc":
             return False
 
         # Check parent dir names to see if file should be included,
         # but ignore dir names above root of mounted module:
         # /a/.venv/site-packages/mymod/foo.py should be included by default
         # /a/my_mod/.config/foo.py should *not* be included by default
-        while path != module_base and path != path.parent:
-            if SKIP_BYTECODE and path.name == "__pycache__":
+        if f.startswith(module_base_prefix):
+            # Fast path for files found by walking the module base: the names to check are just the
+            # components of the path after the base prefix, so there's no need to walk up the parents.
+            names = f[len(module_base_prefix) :].split(os.sep)
+        else:
+            names = []
+            path = Path(f)
+            while path != module_base and path != path.parent:
+                names.append(path.name)
+                path = path.parent
+
+        for name in names:
+            if SKIP_BYTECODE and name == "__pycache__":
                 return False
 
-            if SKIP_DOT_PREFIXED and path.name.startswith("."):
+            if SKIP_DOT_PREFIXED and name.startswith("."):
                 return False
 
-            path = path.parent
-
         return True
 
     return condition
@@ -419,21 +458,52 @@ class _Mount(_Object, type_prefix="mo"):
     @staticmethod
     async def _get_files(entries: List[_MountEntry]) -> AsyncGenerator[FileUploadSpec, None]:
         loop = asyncio.get_event_loop()
-        with concurrent.futures.ThreadPoolExecutor() as exe:
-            all_files = await loop.run_in_executor(exe, _select_files, entries)
-
-            futs = []
-            for local_filename, remote_filename in all_files:
+        # Holds completed checksum futures, plus a None once the directory walk has finished
+        results: asyncio.Queue[Optional[concurrent.futures.Future]] = asyncio.Queue()
+
+        def _on_checksum_done(fut: concurrent.futures.Future):
+            loop.call_soon_threadsafe(results.put_nowait, fut)
+
+        # Set when the consumer stops early, so that the walk doesn't keep submitting to a closing executor
+        stop_walk = threading.Event()
+
+        def _walk_and_submit(exe: concurrent.futures.Executor) -> int:
+            # Submit files for checksumming while the directories are still being walked,
+            # so that uploads can start right away.
+            n_files = 0
+            for local_filename, remote_filename in _iter_files(entries):
+                if stop_walk.is_set():
+                    break
                 logger.debug(f"Mounting {local_filename} as {remote_filename}")
-                futs.append(loop.run_in_executor(exe, get_file_upload_spec_from_path, local_filename, remote_filename))
+                fut = exe.submit(get_file_upload_spec_from_path, local_filename, remote_filename)
+                fut.add_done_callback(_on_checksum_done)
+                n_files += 1
+            logger.debug(f"Computing checksums for {n_files} files")
+            return n_files
 
-            logger.debug(f"Computing checksums for {len(futs)} files using {exe._max_workers} worker threads")
-            for fut in asyncio.as_completed(futs):
-                try:
-                    yield await fut
-                except FileNotFoundError as exc:
-                    # Can happen with temporary files (e.g. emacs will write temp files and delete them quickly)
-                    logger.info(f"Ignoring file not found: {exc}")
+        with concurrent.futures.ThreadPoolExecutor() as exe:
+            walk_fut = loop.run_in_executor(exe, _walk_and_submit, exe)
+            walk_fut.add_done_callback(lambda _: results.put_nowait(None))
+
+            n_files: Optional[int] = None
+            n_finished = 0
+            try:
+                while n_files is None or n_finished < n_files:
+                    fut = await results.get()
+                    if fut is None:
+                        n_files = await walk_fut  # re-raises errors from walking the directories
+                        continue
+                    n_finished += 1
+                    try:
+                        yield fut.result()
+                    except FileNotFoundError as exc:
+                        # Can happen with temporary files (e.g. emacs will write temp files and delete them quickly)
+                        logger.info(f"Ignoring file not found: {exc}")
+            finally:
+                # If we're exiting early (generator closed, or an error), the walk may still be running.
+                # Wait for it to stop before the executor shuts down, and retrieve any error it raised.
+                stop_walk.set()
+                await asyncio.gather(walk_fut, return_exceptions=True)
 
     async def _load_mount(
         self: "_Mount",
@@ -481,7 +551,7 @@ class _Mount(_Object, type_prefix="mo"):
                 logger.debug(f"Creating blob file for {file_spec.source_description} ({file_spec.size} bytes)")
                 async with blob_upload_concurrency:
                     with file_spec.source() as fp:
-                        blob_id = await blob_upload_file(fp, resolver.client.stub)
+                        blob_id = await blob_upload_file(fp, resolver.client.stub, sha256_hex=file_spec.sha256_hex)
                 logger.debug(f"Uploading blob file {file_spec.source_description} as {remote_filename}")
                 request2 = api_pb2.MountPutFileRequest(data_blob_id=blob_id, sha256_hex=file_spec.sha256_hex)
             else:
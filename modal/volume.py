@@ -21,6 +21,7 @@ from typing import (
     List,
     Optional,
     Sequence,
+    Set,
     Type,
     Union,
 )
@@ -531,6 +532,7 @@ class _VolumeUploadContextManager:
     _force: bool
     progress_cb: Callable[..., Any]
     _upload_generators: List[Generator[Callable[[], FileUploadSpec], None, None]]
+    _accounted_hashes: Set[str]
 
     def __init__(
         self, volume_id: str, client: _Client, progress_cb: Optional[Callable[..., Any]] = None, force: bool = False
@@ -541,6 +543,7 @@ class _VolumeUploadContextManager:
         self._upload_generators = []
         self._progress_cb = progress_cb or (lambda *_, **__: None)
         self._force = force
+        self._accounted_hashes = set()
 
     async def __aenter__(self):
         return self
@@ -633,7 +636,19 @@ class _VolumeUploadContextManager:
     async def _upload_file(self, file_spec: FileUploadSpec) -> api_pb2.MountFile:
         remote_filename = file_spec.mount_filename
         progress_task_id = self._progress_cb(name=remote_filename, size=file_spec.size)
+        mount_file = api_pb2.MountFile(
+            filename=remote_filename,
+            sha256_hex=file_spec.sha256_hex,
+            mode=file_spec.mode,
+        )
+
+        if file_spec.sha256_hex in self._accounted_hashes:
+            # Identical content is already being uploaded for another file in this batch
+            self._progress_cb(task_id=progress_task_id, complete=True)
+            return mount_file
+
         request = api_pb2.MountPutFileRequest(sha256_hex=file_spec.sha256_hex)
+        self._accounted_hashes.add(file_spec.sha256_hex)
         response = await retry_transient_errors(self._client.stub.MountPutFile, request, base_delay=1)
 
         start_time = time.monotonic()
@@ -642,7 +657,10 @@ class _VolumeUploadContextManager:
                 logger.debug(f"Creating blob file for {file_spec.source_description} ({file_spec.size} bytes)")
                 with file_spec.source() as fp:
                     blob_id = await blob_upload_file(
-                        fp, self._client.stub, functools.partial(self._progress_cb, progress_task_id)
+                        fp,
+                        self._client.stub,
+                        functools.partial(self._progress_cb, progress_task_id),
+                        sha256_hex=file_spec.sha256_hex,
                     )
                 logger.debug(f"Uploading blob file {file_spec.source_description} as {remote_filename}")
                 request2 = api_pb2.MountPutFileRequest(data_blob_id=blob_id, sha256_hex=file_spec.sha256_hex)
@@ -662,11 +680,7 @@ class _VolumeUploadContextManager:
                 raise VolumeUploadTimeoutError(f"Uploading of {file_spec.source_description} timed out")
         else:
             self._progress_cb(task_id=progress_task_id, complete=True)
-        return api_pb2.MountFile(
-            filename=remote_filename,
-            sha256_hex=file_spec.sha256_hex,
-            mode=file_spec.mode,
-        )
+        return mount_file
 
 
 Volume = synchronize_api(_Volume)
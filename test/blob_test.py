@@ -1,10 +1,15 @@
 # Copyright Modal Labs 2022
 
+import hashlib
+import os
 import pytest
 import random
+from pathlib import PurePosixPath
 
+from modal._utils import blob_utils
 from modal._utils.async_utils import synchronize_api
 from modal._utils.blob_utils import (
+    LARGE_FILE_LIMIT,
     blob_download as _blob_download,
     blob_upload as _blob_upload,
     blob_upload_file as _blob_upload_file,
@@ -68,6 +73,60 @@ async def test_blob_multipart(servicer, blob_server, client, monkeypatch, tmp_pa
     assert await blob_download.aio(blob_id, client.stub) == data
 
 
+@pytest.mark.asyncio
+async def test_blob_upload_file_known_sha256(servicer, blob_server, client, monkeypatch, tmp_path):
+    def get_upload_hashes(data):
+        raise AssertionError("file should not be sha256-hashed again")
+
+    monkeypatch.setattr("modal._utils.blob_utils.get_upload_hashes", get_upload_hashes)
+    data = b"0123456789" * 1000
+    data_filepath = tmp_path / "temp.bin"
+    data_filepath.write_bytes(data)
+    with data_filepath.open("rb") as fp:
+        blob_id = await blob_upload_file.aio(fp, client.stub, sha256_hex=hashlib.sha256(data).hexdigest())
+    assert await blob_download.aio(blob_id, client.stub) == data
+
+
 def test_sync(blob_server, client):
     # just tests that tests running blocking calls that upload to blob storage don't deadlock
     blob_upload(b"adsfadsf", client.stub)
+
+
+def test_large_file_hash_cache(tmp_path, monkeypatch):
+    large_file = tmp_path / "large.bin"
+    large_file.write_bytes(b"a" * LARGE_FILE_LIMIT)
+
+    calls = []
+    original_get_sha256_hex = blob_utils.get_sha256_hex
+
+    def get_sha256_hex(data):
+        calls.append(data)
+        return original_get_sha256_hex(data)
+
+    monkeypatch.setattr(blob_utils, "get_sha256_hex", get_sha256_hex)
+    monkeypatch.setattr(blob_utils, "_large_file_sha256_cache", {})
+    spec = blob_utils.get_file_upload_spec_from_path(large_file, PurePosixPath("/large.bin"))
+    assert spec.sha256_hex == hashlib.sha256(b"a" * LARGE_FILE_LIMIT).hexdigest()
+    assert len(calls) == 1
+
+    # Unchanged file isn't hashed again
+    spec2 = blob_utils.get_file_upload_spec_from_path(large_file, PurePosixPath("/large.bin"))
+    assert spec2.sha256_hex == spec.sha256_hex
+    assert len(calls) == 1
+
+    # Changed file is
+    large_file.write_bytes(b"b" * (LARGE_FILE_LIMIT + 1))
+    spec = blob_utils.get_file_upload_spec_from_path(large_file, PurePosixPath("/large.bin"))
+    assert spec.sha256_hex == hashlib.sha256(b"b" * (LARGE_FILE_LIMIT + 1)).hexdigest()
+    assert len(calls) == 2
+
+    # Also when the size stays the same and the mtime is restored afterwards
+    stat = os.stat(large_file)
+    large_file.write_bytes(b"c" * (LARGE_FILE_LIMIT + 1))
+    os.utime(large_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    spec = blob_utils.get_file_upload_spec_from_path(large_file, PurePosixPath("/large.bin"))
+    assert spec.sha256_hex == hashlib.sha256(b"c" * (LARGE_FILE_LIMIT + 1)).hexdigest()
+    assert len(calls) == 3
+
+    # Only the latest checksum of each file is kept
+    assert len(blob_utils._large_file_sha256_cache) == 1
@@ -716,6 +716,25 @@ def test_image_gpu(builder_version, servicer, client):
         assert layers[0].gpu_config.type == api_pb2.GPU_TYPE_A10G
 
 
+def test_identical_images_are_built_once(builder_version, servicer, client):
+    app = App()
+
+    def f():
+        pass
+
+    def g():
+        pass
+
+    app.function(image=Image.debian_slim().pip_install("foo"), serialized=True)(f)
+    app.function(image=Image.debian_slim().pip_install("foo"), serialized=True)(g)
+    with servicer.intercept() as ctx:
+        with app.run(client=client):
+            pass
+
+    # one request each for the shared debian_slim base and the pip_install layer
+    assert len(ctx.get_requests("ImageGetOrCreate")) == 2
+
+
 def test_image_force_build(builder_version, servicer, client):
     app = App()
     app.image = Image.debian_slim().run_commands("echo 1").pip_install("foo", force_build=True).run_commands("echo 2")
@@ -1060,15 +1079,16 @@ def test_image_stability_on_2024_04(force_2024_04, servicer, client, test_dir):
     assert get_hash(img) == "bfce5811c04c1243f12cbb9cca1522cb901f52410986925bcfa3b3c2d7adc7a0"
 
 
+# Uses different base images, since identical image definitions are only built once per app
 parallel_app = App()
 
 
-@parallel_app.function(image=Image.debian_slim().run_commands("sleep 1", "echo hi"))
+@parallel_app.function(image=Image.debian_slim(python_version="3.10").run_commands("sleep 1", "echo hi"))
 def f1():
     pass
 
 
-@parallel_app.function(image=Image.debian_slim().run_commands("sleep 1", "echo bye"))
+@parallel_app.function(image=Image.debian_slim(python_version="3.11").run_commands("sleep 1", "echo bye"))
 def f2():
     pass
 
@@ -9,7 +9,7 @@ from pathlib import Path
 from modal import App
 from modal._utils.blob_utils import LARGE_FILE_LIMIT
 from modal.exception import ModuleNotMountable
-from modal.mount import Mount
+from modal.mount import Mount, module_mount_condition
 
 
 @pytest.mark.asyncio
@@ -160,3 +160,40 @@ def test_chained_entries(test_dir):
     m.update(b"A")
     assert files[0].sha256_hex == m.hexdigest()
     assert files[0].use_blob is False
+
+
+def test_local_dir_recursive(tmp_path):
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "top.py").write_text("")
+    (tmp_path / "a" / "mid.py").write_text("")
+    (tmp_path / "a" / "b" / "bottom.py").write_text("")
+    (tmp_path / "a" / "b" / "skip.txt").write_text("")
+
+    def condition(fn):
+        return fn.endswith(".py")
+
+    mount = Mount.from_local_dir(tmp_path, remote_path="/dir", condition=condition)
+    files = {remote_path.as_posix(): local_path for local_path, remote_path in mount.entries[0].get_files_to_upload()}
+    assert files == {
+        "/dir/top.py": str(tmp_path / "top.py"),
+        "/dir/a/mid.py": str(tmp_path / "a" / "mid.py"),
+        "/dir/a/b/bottom.py": str(tmp_path / "a" / "b" / "bottom.py"),
+    }
+
+    mount = Mount.from_local_dir(tmp_path, remote_path="/dir", condition=condition, recursive=False)
+    non_recursive_files = {remote_path.as_posix() for _, remote_path in mount.entries[0].get_files_to_upload()}
+    assert non_recursive_files == {"/dir/top.py"}
+
+
+def test_module_mount_condition(tmp_path):
+    module_base = tmp_path / ".venv" / "mymod"
+    condition = module_mount_condition(module_base)
+    assert condition(str(module_base / "foo.py"))
+    assert condition(str(module_base / "sub" / "bar.txt"))
+    assert not condition(str(module_base / "foo.pyc"))
+    assert not condition(str(module_base / "__pycache__" / "foo.py"))
+    assert not condition(str(module_base / ".config" / "foo.py"))
+    assert not condition(str(module_base / "sub" / ".hidden"))
+    # paths outside of the module base are checked all the way up
+    assert condition(str(tmp_path / "other" / "foo.py"))
+    assert not condition(str(tmp_path / ".other" / "foo.py"))
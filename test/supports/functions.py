@@ -81,7 +81,7 @@ def raises_keyboardinterrupt(x):
 @app.function()
 def gen_n(n):
     for i in range(n):
-        yield i**2
+        yield i * i
 
 
 @app.function()
@@ -89,12 +89,12 @@ def gen_n_fail_on_m(n, m):
     for i in range(n):
         if i == m:
             raise Exception("bad")
-        yield i**2
+        yield i * i
 
 
 def deprecated_function(x):
     deprecation_warning((2000, 1, 1), "This function is deprecated")
-    return x**2
+    return x * x
 
 
 @app.function()
@@ -137,7 +137,7 @@ if __name__ == "__main__":
 
 def gen(n):
     for i in range(n):
-        yield i**2
+        yield i * i
 
 
 @app.function(is_generator=True)
@@ -396,7 +396,7 @@ class Cls:
         return web_app
 
     def _generator(self, x):
-        yield x**3
+        yield x * x * x
 
     @method(is_generator=True)
     def generator(self, x):
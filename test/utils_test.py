@@ -1,10 +1,12 @@
 # Copyright Modal Labs 2022
 import asyncio
+import gzip
 import hashlib
 import io
 import pytest
 
 from modal._utils.blob_utils import BytesIOSegmentPayload
+from modal._utils.hash_utils import HASH_CHUNK_SIZE, get_sha256_hex, get_upload_hashes
 from modal._utils.name_utils import (
     check_object_name,
     is_valid_environment_name,
@@ -125,3 +127,53 @@ def test_parse_major_minor_version():
         parse_major_minor_version("123")
     with pytest.raises(ValueError, match="at least an 'X.Y' format with integral"):
         parse_major_minor_version("x.y")
+
+
+@pytest.mark.parametrize("buffered", [False, True])
+def test_hash_fileobj(buffered):
+    data = b"abc" * (HASH_CHUNK_SIZE // 2)  # spans multiple chunks
+    fp = io.BufferedReader(io.BytesIO(data)) if buffered else io.BytesIO(data)  # type: ignore
+    fp.seek(5)
+    assert get_sha256_hex(fp) == hashlib.sha256(data[5:]).hexdigest()
+    assert fp.tell() == 5  # position is restored
+    fp.seek(0)
+    assert get_upload_hashes(fp) == get_upload_hashes(data)
+    fp.seek(len(data))
+    assert get_sha256_hex(fp) == hashlib.sha256(b"").hexdigest()
+    with pytest.raises(ValueError, match="Only accepts bytes"):
+        get_sha256_hex(io.StringIO("abc"))  # type: ignore
+
+
+def test_hash_read_only_fileobj():
+    class ReadOnlyFile:
+        # file-like object without readinto()
+        def __init__(self, data: bytes):
+            self._fp = io.BytesIO(data)
+            self.read = self._fp.read
+            self.seek = self._fp.seek
+            self.tell = self._fp.tell
+
+    data = b"abc" * HASH_CHUNK_SIZE
+    fp = ReadOnlyFile(data)
+    assert get_sha256_hex(fp) == hashlib.sha256(data).hexdigest()  # type: ignore
+    assert fp.tell() == 0
+
+
+def test_hash_large_file(tmp_path):
+    data = b"abc" * (HASH_CHUNK_SIZE // 2)  # spans multiple chunks
+    with open(tmp_path / "large.bin", "w+b") as fp:
+        fp.write(data)  # unflushed writes should be included in the hash
+        fp.seek(5)
+        assert get_sha256_hex(fp) == hashlib.sha256(data[5:]).hexdigest()
+        assert fp.tell() == 5
+        fp.seek(0)
+        assert get_upload_hashes(fp) == get_upload_hashes(data)
+
+
+def test_hash_compressed_file(tmp_path):
+    # The hash covers the bytes read from the file object, not the compressed bytes on disk
+    data = b"abc" * (HASH_CHUNK_SIZE // 2)
+    with gzip.open(tmp_path / "data.gz", "wb") as fp:
+        fp.write(data)
+    with gzip.open(tmp_path / "data.gz", "rb") as fp:
+        assert get_sha256_hex(fp) == hashlib.sha256(data).hexdigest()  # type: ignore
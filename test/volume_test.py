@@ -146,6 +146,7 @@ async def test_volume_batch_upload(servicer, client, tmp_path):
     assert servicer.volume_files[object_id]["/non-recursive/smol"].data == b"###"
     assert servicer.volume_files[object_id]["/filelike2"].data == b"hello world"
     assert servicer.volume_files[object_id]["/filelike2"].mode == 0o644
+    assert servicer.n_mount_files == 4  # files with identical contents are only uploaded once
 
 
 @pytest.mark.asyncio